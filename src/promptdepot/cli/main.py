@@ -1,8 +1,44 @@
+import importlib
+from typing import Any
+
+import click
 import typer
-from promptdepot.cli.templates import templates_app
-from promptdepot.cli.versions import versions_app
+from typer.core import TyperGroup
+
+# Sub-command groups are imported only when dispatched to, so that argument
+# errors and unrelated sub-commands don't pay for their imports.
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "templates": ("promptdepot.cli.templates", "templates_app"),
+    "versions": ("promptdepot.cli.versions", "versions_app"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that resolves ``LAZY_SUBCOMMANDS`` on first access."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_groups: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *LAZY_SUBCOMMANDS})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in LAZY_SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+        group = self._lazy_groups.get(cmd_name)
+        if group is None:
+            module_path, attr_name = LAZY_SUBCOMMANDS[cmd_name]
+            sub_app = getattr(importlib.import_module(module_path), attr_name)
+            group = typer.main.get_group(sub_app)
+            group.name = cmd_name
+            self._lazy_groups[cmd_name] = group
+        return group
+
+
+app = typer.Typer(cls=LazyTyperGroup)
 
-app = typer.Typer()
 
-app.add_typer(templates_app, name="templates")
-app.add_typer(versions_app, name="versions")
+@app.callback()
+def main_callback() -> None:
+    """Manage prompt templates and their versions."""
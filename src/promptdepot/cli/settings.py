@@ -1,4 +1,6 @@
 import sys
+from copy import deepcopy
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -9,6 +11,11 @@ from pydantic_settings import (
     TomlConfigSettingsSource,
 )
 
+if sys.version_info < (3, 11):  # pragma: no cover
+    import tomli as toml_lib  # noqa: S403  # ty:ignore[unresolved-import]
+else:
+    import tomllib as toml_lib  # type: ignore[no-redef]
+
 
 class StoreSettings(BaseModel):
     """Store-related settings."""
@@ -20,15 +27,21 @@ class PyprojectTomlSource(TomlConfigSettingsSource):
     """Reads settings from the ``[tool.promptdepot]`` table in pyproject.toml."""
 
     def _read_file(self, file_path: Path) -> dict[str, Any]:
-        if sys.version_info < (3, 11):  # pragma: no cover
-            import tomli as toml_lib  # noqa: S403  # ty:ignore[unresolved-import]
-        else:
-            import tomllib as toml_lib  # type: ignore[no-redef]
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return {}
+        data = _load_promptdepot_table(str(file_path), stat.st_mtime_ns, stat.st_size)
+        return deepcopy(data)
+
 
-        with file_path.open(mode="rb") as f:
-            data = toml_lib.load(f)
+@lru_cache(maxsize=4)
+def _load_promptdepot_table(file_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the ``[tool.promptdepot]`` table, cached by file path and stat."""
+    with open(file_path, mode="rb") as f:
+        data = toml_lib.load(f)
 
-        return data.get("tool", {}).get("promptdepot", {})
+    return data.get("tool", {}).get("promptdepot", {})
 
 
 class Settings(BaseSettings):
@@ -46,11 +59,24 @@ class Settings(BaseSettings):
         dotenv_settings: PydanticBaseSettingsSource,
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> tuple[PydanticBaseSettingsSource, ...]:
+        pyproject_path = Path("pyproject.toml")
+        if not pyproject_path.is_file():
+            return (init_settings, env_settings)
         return (
             init_settings,
             env_settings,
-            PyprojectTomlSource(settings_cls, toml_file=Path("pyproject.toml")),
+            PyprojectTomlSource(settings_cls, toml_file=pyproject_path),
         )
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Load the CLI settings once, on first use."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``settings`` importable without reading pyproject.toml at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,13 @@
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from promptdepot.stores.core import TemplateStore
+from promptdepot.cli.utils import get_console, get_store
 
-from promptdepot.cli.utils import get_store
+if TYPE_CHECKING:
+    from promptdepot.stores.core import TemplateStore
 
 templates_app = typer.Typer(help="Manage prompt templates.")
-console = Console()
 
 
 @templates_app.command("create")
@@ -15,6 +15,7 @@ def templates_create() -> None:
     """Create a new prompt template."""
     store: TemplateStore = get_store()
     template_id = typer.prompt("Enter a unique template ID")
+    console = get_console()
     try:
         store.create_template(template_id=template_id)
         console.print(f"[green]Template '{template_id}' created successfully![/green]")
@@ -26,16 +27,17 @@ def templates_create() -> None:
 def templates_ls() -> None:
     """List all prompt templates."""
     store: TemplateStore = get_store()
-    templates = store.list_templates()
+
+    from rich.table import Table
 
     table = Table(title="Prompt Templates")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Latest Version", style="magenta")
 
-    for template in templates:
+    for template in store.iter_templates():
         table.add_row(template.id, str(template.latest_version))
 
-    console.print(table)
+    get_console().print(table)
 
 
 @templates_app.command("show")
@@ -45,13 +47,14 @@ def templates_show(
     """Show a specific prompt template."""
     store: TemplateStore = get_store()
     template = store.get_template(template_id)
-    versions = store.list_template_versions(template_id)
+
+    from rich.table import Table
 
     table = Table(title=f"Template: {template_id} ({template.latest_version})")
     table.add_column("Version", style="cyan", no_wrap=True)
     table.add_column("Description", style="magenta")
-    for version in versions:
+    for version in store.iter_template_versions(template_id):
         description = version.metadata.description or ""
         table.add_row(str(version.version), description)
 
-    console.print(table)
+    get_console().print(table)
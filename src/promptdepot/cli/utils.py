@@ -1,15 +1,36 @@
 import importlib
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from promptdepot.cli.settings import settings
-from promptdepot.stores.core import TemplateStore
+if TYPE_CHECKING:
+    from rich.console import Console
 
+    from promptdepot.stores.core import TemplateStore
 
-def get_store() -> TemplateStore:
+
+def get_store() -> "TemplateStore":
     """Get the template store instance based on CLI settings."""
+    from promptdepot.cli.settings import get_settings
+
+    settings = get_settings()
     store_path = settings.store_path
     store_config = settings.store.config
 
     module_path, class_name = store_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    store_cls = getattr(module, class_name)
+    store_cls = cached_import(module_path, class_name)
     return store_cls(config=store_config)
+
+
+@cache
+def cached_import(module_path: str, item_name: str) -> Any:
+    """Import ``item_name`` from ``module_path``, caching successful lookups."""
+    module = importlib.import_module(module_path)
+    return getattr(module, item_name)
+
+
+@cache
+def get_console() -> "Console":
+    """Get the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
@@ -1,13 +1,24 @@
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from promptdepot.stores.core import CreationStrategy, TemplateStore
+from promptdepot.cli.utils import get_console, get_store
 
-from promptdepot.cli.utils import get_store
+if TYPE_CHECKING:
+    from promptdepot.stores.core import TemplateStore
 
 versions_app = typer.Typer(help="Manage versions of a prompt template.")
-console = Console()
+
+
+def _validate_strategy_flags(
+    *, from_previous: bool, empty: bool, with_content: bool
+) -> None:
+    selected_flags = [from_previous, empty, with_content]
+    if sum(1 for flag in selected_flags if flag) > 1:
+        raise typer.BadParameter(
+            "Options --from-previous, --empty, and --with-content are mutually exclusive. "
+            "Please specify at most one."
+        )
 
 
 @versions_app.command("create")
@@ -43,20 +54,20 @@ def versions_create(
     ),
 ) -> None:
     """Create a new version of a prompt template."""
+    # Ensure mutually exclusive creation strategy flags before touching the store
+    _validate_strategy_flags(
+        from_previous=from_previous, empty=empty, with_content=with_content
+    )
+
     store: TemplateStore = get_store()
+    console = get_console()
     if not version:
         latest_version = store.get_template(template_id).latest_version
         version = typer.prompt(
             f"Version not provided. Please enter a version identifier. Current version is {latest_version}."
         )
 
-    # Ensure mutually exclusive creation strategy flags
-    selected_flags = [from_previous, empty, with_content]
-    if sum(1 for flag in selected_flags if flag) > 1:
-        raise typer.BadParameter(
-            "Options --from-previous, --empty, and --with-content are mutually exclusive. "
-            "Please specify at most one."
-        )
+    from promptdepot.stores.core import CreationStrategy
 
     if from_previous:
         strategy = CreationStrategy.FROM_PREVIOUS_VERSION
@@ -96,7 +107,8 @@ def versions_ls(
 ) -> None:
     """List all versions of a prompt template."""
     store: TemplateStore = get_store()
-    versions = store.list_template_versions(template_id)
+
+    from rich.table import Table
 
     table = Table(title=f"Versions for Template: {template_id}")
     table.add_column("Version", style="cyan", no_wrap=True)
@@ -106,24 +118,19 @@ def versions_ls(
     table.add_column("Tags", style="blue")
     table.add_column("Model", style="red")
     table.add_column("Changelog", style="white")
-    for version in versions:
-        description = version.metadata.description
-        created_at = version.metadata.created_at
-        author = version.metadata.author
-        tags = ", ".join(version.metadata.tags or [])
-        model = version.metadata.model
-        changelog = "\n".join(version.metadata.changelog or [])
+    for version in store.iter_template_versions(template_id):
+        metadata = version.metadata
         table.add_row(
             str(version.version),
-            description or "",
-            str(created_at),
-            author or "",
-            tags,
-            model or "",
-            changelog or "",
+            metadata.description or "",
+            str(metadata.created_at),
+            metadata.author or "",
+            ", ".join(sorted(metadata.tags)),
+            metadata.model or "",
+            "\n".join(metadata.changelog),
         )
 
-    console.print(table)
+    get_console().print(table)
 
 
 @versions_app.command("show")
@@ -135,12 +142,13 @@ def versions_show(
     store: TemplateStore = get_store()
     version_data = store.get_template_version(template_id, version)
     metadata = version_data.metadata
+    console = get_console()
     console.print(f"[bold cyan]Template ID:[/bold cyan] {template_id}")
     console.print(f"[bold cyan]Version:[/bold cyan] {version}")
     console.print(f"[bold cyan]Description:[/bold cyan] {metadata.description}")
     console.print(f"[bold cyan]Created At:[/bold cyan] {metadata.created_at}")
     console.print(f"[bold cyan]Author:[/bold cyan] {metadata.author}")
-    console.print(f"[bold cyan]Tags:[/bold cyan] {', '.join(metadata.tags or [])}")
+    console.print(f"[bold cyan]Tags:[/bold cyan] {', '.join(sorted(metadata.tags))}")
     console.print(f"[bold cyan]Model:[/bold cyan] {metadata.model}")
     console.print("[bold cyan]Changelog:[/bold cyan]")
     for change in metadata.changelog:
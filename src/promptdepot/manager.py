@@ -1,4 +1,7 @@
-from collections.abc import Mapping
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from functools import lru_cache
 from typing import Any, Generic, TypeVar, cast
 
 from promptdepot.renderers import PromptRenderer
@@ -6,6 +9,50 @@ from promptdepot.stores import PromptVersion, TemplateStore
 
 ConfigDictT = TypeVar("ConfigDictT", bound=Mapping[str, Any])
 
+RenderCacheKey = tuple[tuple[str, str], Hashable]
+
+
+@lru_cache(maxsize=1024)
+def _version_str(version: PromptVersion) -> str:
+    """Stringify and intern a version so cache keys compare by identity."""
+    return sys.intern(str(version))
+
+
+def _template_key(template_id: str) -> str:
+    """Intern a template id; str subclasses such as str Enums can't be interned."""
+    if type(template_id) is str:
+        return sys.intern(template_id)
+    return str(template_id)
+
+
+_IMMUTABLE_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _freeze_value(value: Any) -> Hashable:
+    """Tag ``value`` with its type, raising TypeError unless it is immutable."""
+    value_type = type(value)
+    if value_type in _IMMUTABLE_SCALARS:
+        return (value_type, value)
+    if value_type is tuple:
+        return (tuple, tuple(_freeze_value(item) for item in value))
+    if value_type is frozenset:
+        return (frozenset, frozenset(_freeze_value(item) for item in value))
+    raise TypeError(f"{value_type.__name__} is not a cacheable context value")
+
+
+def _freeze_context(context: Mapping[str, Any]) -> Hashable | None:
+    """Return a hashable snapshot of ``context``, or None if it can't be cached.
+
+    Only immutable scalars and tuples/frozensets of them are accepted: other
+    objects hash by identity and may render differently between calls.
+    """
+    try:
+        return tuple(
+            sorted((key, _freeze_value(value)) for key, value in context.items())
+        )
+    except TypeError:
+        return None
+
 
 class PromptDepotManager(Generic[ConfigDictT]):
     def __init__(
@@ -14,12 +61,17 @@ class PromptDepotManager(Generic[ConfigDictT]):
         renderer: type[PromptRenderer[str, ConfigDictT]],
         *,
         default_config: ConfigDictT | None = None,
+        renderer_cache_maxsize: int = 128,
+        render_cache_maxsize: int = 0,
     ):
         self.store = store
         self.renderer_cls = renderer
-        self.renderer_cache: dict[
+        self.renderer_cache: OrderedDict[
             tuple[str, str], PromptRenderer[str, ConfigDictT]
-        ] = {}
+        ] = OrderedDict()
+        self.renderer_cache_maxsize = renderer_cache_maxsize
+        self.render_cache: OrderedDict[RenderCacheKey, str] = OrderedDict()
+        self.render_cache_maxsize = render_cache_maxsize
         self.default_config: ConfigDictT = (
             cast(ConfigDictT, dict(default_config))
             if default_config is not None
@@ -32,16 +84,37 @@ class PromptDepotManager(Generic[ConfigDictT]):
         version: PromptVersion,
         context: Mapping[str, Any],
     ) -> str:
-        versioned_template_id = (template_id, str(version))
+        versioned_template_id = (_template_key(template_id), _version_str(version))
+        render_key: RenderCacheKey | None = None
+        if self.render_cache_maxsize > 0:
+            frozen_context = _freeze_context(context)
+            if frozen_context is not None:
+                render_key = (versioned_template_id, frozen_context)
+                rendered = self.render_cache.get(render_key)
+                if rendered is not None:
+                    self.render_cache.move_to_end(render_key)
+                    return rendered
+
         renderer = self.renderer_cache.get(versioned_template_id)
         if renderer is None:
             template_content = self.store.get_template_version_content(
                 template_id, version
             )
+            # Renderers may mutate their config, so each one gets its own shallow
+            # copy. This only runs on a renderer cache miss, not per render.
             renderer = self.renderer_cls.from_template(
                 template_content,
                 config=cast(ConfigDictT, dict(self.default_config)),
             )
             self.renderer_cache[versioned_template_id] = renderer
+            if len(self.renderer_cache) > self.renderer_cache_maxsize:
+                self.renderer_cache.popitem(last=False)
+        else:
+            self.renderer_cache.move_to_end(versioned_template_id)
 
-        return renderer.render(context=context)
+        rendered = renderer.render(context=context)
+        if render_key is not None:
+            self.render_cache[render_key] = rendered
+            if len(self.render_cache) > self.render_cache_maxsize:
+                self.render_cache.popitem(last=False)
+        return rendered
@@ -1,5 +1,30 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .core import PromptRenderer
 
+if TYPE_CHECKING:
+    from .jinja2 import Jinja2PromptRenderer as Jinja2PromptRenderer
+    from .mako import MakoPromptRenderer as MakoPromptRenderer
+
+# Engine renderers depend on optional extras, so they are only imported on
+# first attribute access and kept out of ``__all__`` so that a star import
+# works without the extras installed.
+_LAZY_EXPORTS = {
+    "Jinja2PromptRenderer": ".jinja2",
+    "MakoPromptRenderer": ".mako",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "PromptRenderer",
 ]
@@ -1,4 +1,5 @@
 from collections.abc import Mapping
+from functools import cache
 from typing import TypedDict, Any
 
 from jinja2 import Environment
@@ -10,11 +11,18 @@ class Jinja2PromptRendererConfig(TypedDict):
     environment: Environment | None
 
 
+@cache
+def _default_environment() -> Environment:
+    """Shared environment used by renderers configured without one."""
+    return Environment(autoescape=True)
+
+
 class Jinja2PromptRenderer(PromptRenderer[str, Jinja2PromptRendererConfig]):
     def __init__(self, template: str, *, config: Jinja2PromptRendererConfig):
         super().__init__(template=template, config=config)
-        self.env = config.get("environment") or Environment(autoescape=True)
+        self.env = config.get("environment") or _default_environment()
         self.compiled_template = self.env.from_string(template)
 
     def render(self, *, context: Mapping[str, Any]) -> str:
-        return self.compiled_template.render(**context)
+        # Jinja2 accepts the mapping positionally, avoiding a kwargs dict build.
+        return self.compiled_template.render(context)
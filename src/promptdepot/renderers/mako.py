@@ -1,4 +1,5 @@
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import TypedDict, Any
 
 from mako.lookup import TemplateLookup
@@ -11,10 +12,21 @@ class MakoPromptRendererConfig(TypedDict):
     lookup: TemplateLookup | None
 
 
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> Template:
+    """Compile a lookup-less template, reusing identical earlier compilations."""
+    return Template(template)  # noqa: S702
+
+
 class MakoPromptRenderer(PromptRenderer[str, MakoPromptRendererConfig]):
     def __init__(self, template: str, *, config: MakoPromptRendererConfig):
         super().__init__(template=template, config=config)
-        self.compiled_template = Template(template, lookup=config.get("lookup"))  # noqa: S702
+        lookup = config.get("lookup")
+        self.compiled_template = (
+            Template(template, lookup=lookup)  # noqa: S702
+            if lookup is not None
+            else _compile_template(template)
+        )
 
     def render(self, *, context: Mapping[str, Any]) -> str:
         return self.compiled_template.render(**context)
@@ -1,7 +1,29 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .core import CreationStrategy, PromptVersion, TemplateStore
 
+if TYPE_CHECKING:
+    from .local import LocalTemplateStore
+
+# Concrete stores are only imported on first access instead of with the package.
+_LAZY_EXPORTS = {
+    "LocalTemplateStore": ".local",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "CreationStrategy",
+    "LocalTemplateStore",
     "PromptVersion",
     "TemplateStore",
 ]
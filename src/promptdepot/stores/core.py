@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Any, TypeAlias
 
 from pydantic import BaseModel, Field
@@ -10,6 +11,18 @@ from pydantic_extra_types.semantic_version import SemanticVersion
 PromptVersion: TypeAlias = SemanticVersion | str
 
 
+@lru_cache(maxsize=1024)
+def _parse_semver(version: str) -> SemanticVersion:
+    return SemanticVersion.parse(version)
+
+
+def as_semver(version: PromptVersion) -> SemanticVersion:
+    """Coerce a ``PromptVersion`` to ``SemanticVersion``, caching string parses."""
+    if isinstance(version, str):
+        return _parse_semver(version)
+    return version
+
+
 class CreationStrategy(Enum):
     FROM_PREVIOUS_VERSION = "from_previous_version"
     EMPTY = "empty"
@@ -27,9 +40,9 @@ class TemplateVersionMetadata(BaseModel):
     created_at: Annotated[datetime, Field(default_factory=datetime.now)]
     description: str | None = None
     author: str | None = None
-    tags: set[str] = set()
+    tags: Annotated[set[str], Field(default_factory=set)]
     model: str | None = None
-    changelog: list[str] = []
+    changelog: Annotated[list[str], Field(default_factory=list)]
 
 
 class TemplateVersion(BaseModel):
@@ -45,6 +58,10 @@ class TemplateStore(ABC):
     @abstractmethod
     def list_templates(self) -> list[Template]: ...
 
+    def iter_templates(self) -> Iterator[Template]:
+        """Yield templates one at a time. Defaults to ``list_templates()``."""
+        return iter(self.list_templates())
+
     @abstractmethod
     def get_template(self, template_id: str) -> Template: ...
 
@@ -57,6 +74,13 @@ class TemplateStore(ABC):
     @abstractmethod
     def list_template_versions(self, template_id: str) -> list[TemplateVersion]: ...
 
+    def iter_template_versions(self, template_id: str) -> Iterator[TemplateVersion]:
+        """Yield template versions one at a time.
+
+        Defaults to ``list_template_versions()``.
+        """
+        return iter(self.list_template_versions(template_id))
+
     @abstractmethod
     def get_template_version(
         self, template_id: str, version: PromptVersion
@@ -1,10 +1,15 @@
 import logging
+import os
+import stat
+from collections.abc import Iterator
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
 from pydantic import ValidationError
 from pydantic_extra_types.semantic_version import SemanticVersion
-from yaml import safe_dump, safe_load
+from yaml import dump, load
 
 from promptdepot.stores.core import (
     CreationStrategy,
@@ -13,8 +18,15 @@ from promptdepot.stores.core import (
     TemplateStore,
     TemplateVersion,
     TemplateVersionMetadata,
+    as_semver,
 )
 
+# Prefer the libyaml-backed safe loader/dumper when PyYAML was built with it.
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 
 class TemplateNotFoundError(FileNotFoundError):
     """Raised when a template or template version is not found."""
@@ -33,6 +45,25 @@ class StoreConfig(TypedDict):
     initial_version: SemanticVersion | None
 
 
+logger = logging.getLogger(__name__)
+
+_entry_name = attrgetter("name")
+
+
+def _load_yaml(content: str | bytes) -> Any:
+    return load(content, Loader=YamlLoader)
+
+
+def _dump_yaml(data: Any) -> str:
+    return dump(data, Dumper=YamlDumper)
+
+
+def _sorted_entries(path: Path) -> list[os.DirEntry[str]]:
+    """List directory entries sorted by name, keeping their cached file types."""
+    with os.scandir(path) as entries:
+        return sorted(entries, key=_entry_name)
+
+
 def _parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from content. Returns (frontmatter_dict, body)."""
     if not content.startswith("---\n"):
@@ -52,7 +83,34 @@ def _parse_frontmatter(content: str) -> tuple[dict, str]:
         return {}, content
     if body.startswith("\n"):
         body = body[1:]
-    return safe_load(yaml_block) or {}, body
+    return _load_yaml(yaml_block) or {}, body
+
+
+@lru_cache(maxsize=1024)
+def _read_frontmatter(path: str, mtime_ns: int, size: int) -> dict:
+    """Read a file's frontmatter, cached by path and stat so edits invalidate it."""
+    # Read raw bytes and decode only the YAML block; the template body is never
+    # decoded here. Invalid UTF-8 raises UnicodeDecodeError, a ValueError.
+    with open(path, "rb") as f:
+        content = f.read()
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if not content.startswith(b"---\n"):
+        return {}
+    end_idx = content.find(b"\n---\n", 4)
+    if end_idx == -1:
+        if len(content) < 8 or not content.endswith(b"\n---"):
+            return {}
+        end_idx = len(content) - 4
+    return _load_yaml(content[4:end_idx].decode()) or {}
+
+
+@lru_cache(maxsize=128)
+def _read_body(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file's template body, cached by path and stat like the frontmatter."""
+    with open(path) as f:
+        _, body = _parse_frontmatter(f.read())
+    return body
 
 
 class LocalTemplateStore(TemplateStore):
@@ -63,15 +121,27 @@ class LocalTemplateStore(TemplateStore):
             if isinstance(config["base_path"], str)
             else config["base_path"]
         )
+        # Kept as a plain string so hot paths can join with os.path instead of Path.
+        self._base_path_str = os.fspath(self.base_path)
         self.initial_version = config.get("initial_version") or SemanticVersion(major=1)
-        self.logger = logging.getLogger(self.__class__.__name__)
 
-    def _read_prompt_metadata(self, template_path: Path) -> TemplateVersionMetadata:
-        if not template_path.exists():
-            raise TemplateNotFoundError(f"Template file not found at '{template_path}'")
+    def _read_prompt_metadata(
+        self, template_path: str | Path
+    ) -> TemplateVersionMetadata:
+        try:
+            st = os.stat(template_path)
+        except FileNotFoundError as e:
+            raise TemplateNotFoundError(
+                f"Template file not found at '{template_path}'"
+            ) from e
+        if not stat.S_ISREG(st.st_mode):
+            raise TemplateNotFoundError(
+                f"Template path '{template_path}' is not a file"
+            )
 
-        content = template_path.read_text()
-        frontmatter, _ = _parse_frontmatter(content)
+        frontmatter = _read_frontmatter(
+            os.fspath(template_path), st.st_mtime_ns, st.st_size
+        )
         if not frontmatter:
             raise TemplateNotFoundError(
                 f"No frontmatter found in template file '{template_path}'"
@@ -81,6 +151,9 @@ class LocalTemplateStore(TemplateStore):
     def _get_template_path(self, template_id: str, version: PromptVersion) -> Path:
         return self.base_path / template_id / f"{version}.md"
 
+    def _get_template_file(self, template_id: str, version: PromptVersion) -> str:
+        return os.path.join(self._base_path_str, template_id, f"{version}.md")
+
     def get_template(self, template_id: str) -> Template:
         try:
             latest_version = self.get_latest_version(template_id)
@@ -93,11 +166,10 @@ class LocalTemplateStore(TemplateStore):
         template_id: str,
         version: PromptVersion,
     ) -> TemplateVersion:
-        version = (
-            SemanticVersion.parse(version) if isinstance(version, str) else version
+        version = as_semver(version)
+        metadata = self._read_prompt_metadata(
+            self._get_template_file(template_id, version)
         )
-        template_path = self._get_template_path(template_id, version)
-        metadata = self._read_prompt_metadata(template_path)
         return TemplateVersion(
             template_id=template_id,
             version=version,
@@ -105,57 +177,95 @@ class LocalTemplateStore(TemplateStore):
         )
 
     def list_templates(self) -> list[Template]:
-        templates: list[Template] = []
-        for template_dir in sorted(
-            self.base_path.iterdir(), key=lambda path: path.name
-        ):
-            if not template_dir.is_dir():
-                continue
-            template_id = template_dir.name
-            try:
-                latest_version = self.get_latest_version(template_id)
-                templates.append(
-                    Template(id=template_id, latest_version=latest_version.version)
-                )
-            except TemplateNotFoundError:
-                self.logger.warning(
-                    f"No valid versions found for template '{template_id}'. Skipping."
-                )
-            except (ValidationError, ValueError, OSError) as e:
-                self.logger.error(
-                    f"Error reading template '{template_id}': {e}. Skipping."
-                )
-        return templates
+        return list(self.iter_templates())
+
+    def iter_templates(self) -> Iterator[Template]:
+        for template_id in self._template_ids():
+            template = self._try_get_template(template_id)
+            if template is not None:
+                yield template
+
+    def _template_ids(self) -> list[str]:
+        return [
+            entry.name for entry in _sorted_entries(self.base_path) if entry.is_dir()
+        ]
+
+    def _try_get_template(self, template_id: str) -> Template | None:
+        """Build a template from its latest version, or log and return None."""
+        try:
+            latest_version = self.get_latest_version(template_id)
+        except TemplateNotFoundError:
+            logger.warning(
+                f"No valid versions found for template '{template_id}'. Skipping."
+            )
+            return None
+        except (ValidationError, ValueError, OSError) as e:
+            logger.error(f"Error reading template '{template_id}': {e}. Skipping.")
+            return None
+        return Template(id=template_id, latest_version=latest_version.version)
+
+    def _sorted_versions(
+        self, template_id: str, template_dir: Path
+    ) -> list[SemanticVersion]:
+        """Parse and sort versions from the ``<version>.md`` file names."""
+        versions: list[SemanticVersion] = []
+        with os.scandir(template_dir) as entries:
+            for entry in entries:
+                version_name, suffix = os.path.splitext(entry.name)
+                if suffix != ".md" or not entry.is_file():
+                    continue
+                try:
+                    versions.append(as_semver(version_name))
+                except ValueError as e:
+                    logger.error(
+                        f"Error reading template '{template_id}' version '{version_name}': {e}"
+                    )
+        versions.sort()
+        return versions
+
+    def _try_get_template_version(
+        self, template_id: str, version: SemanticVersion
+    ) -> TemplateVersion | None:
+        """Load a template version, or log and return None if it can't be read."""
+        try:
+            return self.get_template_version(template_id, version)
+        except TemplateNotFoundError:
+            return None
+        except (ValidationError, ValueError, OSError) as e:
+            logger.error(
+                f"Error reading template '{template_id}' version '{version}': {e}"
+            )
+            return None
 
     def list_template_versions(self, template_id: str) -> list[TemplateVersion]:
+        return list(self.iter_template_versions(template_id))
+
+    def iter_template_versions(self, template_id: str) -> Iterator[TemplateVersion]:
         template_dir = self.base_path / template_id
-        if not template_dir.exists() or not template_dir.is_dir():
+        if not template_dir.is_dir():
             raise TemplateNotFoundError(f"Template '{template_id}' not found")
+        return self._iter_version_files(template_id, template_dir)
 
-        versions: list[TemplateVersion] = []
-        for version_file in sorted(template_dir.iterdir(), key=lambda path: path.name):
-            if not version_file.is_file() or version_file.suffix != ".md":
-                continue
-            version = version_file.stem
-            try:
-                template_version = self.get_template_version(template_id, version)
-                versions.append(template_version)
-            except TemplateNotFoundError:
-                continue
-            except (ValidationError, ValueError, OSError) as e:
-                self.logger.error(
-                    f"Error reading template '{template_id}' version '{version}': {e}"
-                )
-        return versions
+    def _iter_version_files(
+        self, template_id: str, template_dir: Path
+    ) -> Iterator[TemplateVersion]:
+        for version in self._sorted_versions(template_id, template_dir):
+            template_version = self._try_get_template_version(template_id, version)
+            if template_version is not None:
+                yield template_version
 
     def get_latest_version(self, template_id: str) -> TemplateVersion:
-        versions = self.list_template_versions(template_id)
-        if not versions:
-            raise TemplateNotFoundError(
-                f"No versions found for template '{template_id}'"
-            )
-        latest_version = max(versions, key=lambda x: x.version)
-        return latest_version
+        template_dir = self.base_path / template_id
+        if not template_dir.is_dir():
+            raise TemplateNotFoundError(f"Template '{template_id}' not found")
+
+        # Pick the newest version from file names and only load its metadata,
+        # falling back to older versions when it can't be read.
+        for version in reversed(self._sorted_versions(template_id, template_dir)):
+            latest_version = self._try_get_template_version(template_id, version)
+            if latest_version is not None:
+                return latest_version
+        raise TemplateNotFoundError(f"No versions found for template '{template_id}'")
 
     def create_version(
         self,
@@ -168,13 +278,13 @@ class LocalTemplateStore(TemplateStore):
     ) -> None:
         template_content = ""
         if content is not None and strategy != CreationStrategy.WITH_CONTENT:
-            self.logger.warning(
+            logger.warning(
                 "Content provided will be ignored because of the creation strategy."
             )
 
         if strategy == CreationStrategy.WITH_CONTENT:
             if content is None:
-                self.logger.warning(
+                logger.warning(
                     "Creation strategy 'WITH_CONTENT' specified but no content provided. Creating version with empty content."
                 )
             else:
@@ -186,27 +296,28 @@ class LocalTemplateStore(TemplateStore):
                     template_id, latest_template.version
                 )
             except TemplateNotFoundError:
-                self.logger.warning(
+                logger.warning(
                     f"No existing versions found for template '{template_id}'. Creating new version with empty content."
                 )
                 template_content = ""
 
-        template_file = self._get_template_path(template_id, version)
-        if template_file.exists():
-            raise VersionAlreadyExistsError(
-                f"Version '{version}' for template '{template_id}' already exists"
-            )
-        template_file.parent.mkdir(parents=True, exist_ok=True)
-
         metadata = metadata or TemplateVersionMetadata(
             template_id=template_id,
-            version=SemanticVersion.parse(version)
-            if isinstance(version, str)
-            else version,
+            version=as_semver(version),
         )  # ty:ignore[missing-argument]
-        yaml_block = safe_dump(metadata.model_dump(mode="json"))
+        yaml_block = _dump_yaml(metadata.model_dump(mode="json"))
         file_content = f"---\n{yaml_block}---\n{template_content}"
-        template_file.write_text(file_content)
+
+        template_file = self._get_template_path(template_id, version)
+        template_file.parent.mkdir(parents=True, exist_ok=True)
+        # Exclusive create replaces a separate exists() check and can't race it.
+        try:
+            with open(template_file, "x") as f:
+                f.write(file_content)
+        except FileExistsError as e:
+            raise VersionAlreadyExistsError(
+                f"Version '{version}' for template '{template_id}' already exists"
+            ) from e
 
     def create_template(
         self,
@@ -221,13 +332,12 @@ class LocalTemplateStore(TemplateStore):
     def get_template_version_content(
         self, template_id: str, version: PromptVersion
     ) -> str:
-        template_path = self._get_template_path(template_id, version)
+        template_path = self._get_template_file(template_id, version)
         try:
-            content = template_path.read_text()
+            st = os.stat(template_path)
         except FileNotFoundError as e:
             raise TemplateNotFoundError(
                 f"Template file not found for template '{template_id}', "
                 f"version '{version}', at path '{template_path}'"
             ) from e
-        _, body = _parse_frontmatter(content)
-        return body
+        return _read_body(template_path, st.st_mtime_ns, st.st_size)
@@ -0,0 +1,63 @@
+import sys
+from unittest.mock import MagicMock
+
+import click.testing
+import pytest
+import typer
+from typer.testing import CliRunner
+
+import promptdepot.cli.templates as templates_module
+from promptdepot.cli.main import LAZY_SUBCOMMANDS, LazyTyperGroup, app
+from promptdepot.stores.core import TemplateStore
+
+runner = CliRunner()
+
+
+def _build_group() -> LazyTyperGroup:
+    group = typer.main.get_command(app)
+    assert isinstance(group, LazyTyperGroup)
+    return group
+
+
+def test_lazy_typer_group_list_commands__should_include_lazy_subcommands():
+    group = _build_group()
+    with typer.Context(group) as ctx:
+        assert group.list_commands(ctx) == sorted(LAZY_SUBCOMMANDS)
+
+
+def test_lazy_typer_group_get_command__should_cache_resolved_group():
+    group = _build_group()
+    with typer.Context(group) as ctx:
+        first = group.get_command(ctx, "templates")
+        second = group.get_command(ctx, "templates")
+
+    assert first is not None
+    assert first is second
+    assert first.name == "templates"
+
+
+def test_lazy_typer_group_get_command__should_return_none_for_unknown_command():
+    group = _build_group()
+    with typer.Context(group) as ctx:
+        assert group.get_command(ctx, "unknown") is None
+
+
+def test_cli_app__should_fail_on_unknown_command():
+    result = runner.invoke(app, ["unknown"])
+
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_lazy_typer_group__should_not_import_unused_subcommand_groups(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delitem(sys.modules, "promptdepot.cli.versions", raising=False)
+    mock_store = MagicMock(spec_set=TemplateStore)
+    mock_store.iter_templates = MagicMock(return_value=iter([]))
+    monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
+
+    result = click.testing.CliRunner().invoke(_build_group(), ["templates", "ls"])
+
+    assert result.exit_code == 0
+    assert "promptdepot.cli.versions" not in sys.modules
@@ -1,10 +1,14 @@
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+import promptdepot.cli.settings as settings_module
 from promptdepot.cli.settings import (
     PyprojectTomlSource,
     Settings,
     StoreSettings,
+    get_settings,
 )
 
 
@@ -98,3 +102,56 @@ def test_settings_settings_customise_sources__should_include_pyproject_toml_sour
     assert sources[0] is None  # init_settings
     assert sources[1] is None  # env_settings
     assert isinstance(sources[2], PyprojectTomlSource)
+
+
+def test_settings_settings_customise_sources__should_skip_pyproject_toml_source_when_file_missing(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    monkeypatch.chdir(tmp_path)
+
+    sources = Settings.settings_customise_sources(
+        Settings,
+        init_settings=None,  # type: ignore[arg-type]
+        env_settings=None,  # type: ignore[arg-type]
+        dotenv_settings=None,  # type: ignore[arg-type]
+        file_secret_settings=None,  # type: ignore[arg-type]
+    )
+    assert sources == (None, None)
+
+
+def test_get_settings__should_return_cached_settings_instance():
+    assert get_settings() is get_settings()
+
+
+def test_settings_module_getattr__should_return_lazy_settings():
+    assert settings_module.settings is get_settings()
+
+
+def test_settings_module_getattr__should_raise_for_unknown_attribute():
+    with pytest.raises(AttributeError):
+        settings_module.unknown_attribute  # noqa: B018
+
+
+def test_pyproject_toml_source_read_file__should_return_empty_dict_when_file_missing(
+    tmp_path: Path,
+):
+    toml_file = tmp_path / "pyproject.toml"
+
+    source = PyprojectTomlSource(Settings, toml_file=toml_file)
+    data: dict[str, Any] = source._read_file(toml_file)
+
+    assert data == {}
+
+
+def test_pyproject_toml_source_read_file__should_reread_file_when_it_changes(
+    tmp_path: Path,
+):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text('[tool.promptdepot]\nstore_path = "first.Store"\n')
+    source = PyprojectTomlSource(Settings, toml_file=toml_file)
+    assert source._read_file(toml_file)["store_path"] == "first.Store"
+
+    toml_file.write_text('[tool.promptdepot]\nstore_path = "second.Store"\n')
+
+    assert source._read_file(toml_file)["store_path"] == "second.Store"
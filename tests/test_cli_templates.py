@@ -1,23 +1,27 @@
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pydantic_extra_types.semantic_version import SemanticVersion
-from typer.testing import CliRunner
+import typer
+from click.testing import CliRunner
 
 import promptdepot.cli.templates as templates_module
 from promptdepot.cli.main import app
 from promptdepot.stores.core import (
     Template,
+    TemplateStore,
     TemplateVersion,
     TemplateVersionMetadata,
+    as_semver,
 )
+from promptdepot.stores.local import LocalTemplateStore
+
+_FIXED_DT = datetime(2025, 1, 1, 12, 0, 0)
 
 
 def _build_template(template_id: str, latest_version: str = "1.0.0") -> Template:
-    return Template(
-        id=template_id, latest_version=SemanticVersion.parse(latest_version)
-    )
+    return Template(id=template_id, latest_version=as_semver(latest_version))
 
 
 def _build_template_version(
@@ -26,14 +30,14 @@ def _build_template_version(
     *,
     description: str | None = "A test prompt",
 ) -> TemplateVersion:
-    sv = SemanticVersion.parse(version)
+    sv = as_semver(version)
     return TemplateVersion(
         template_id=template_id,
         version=sv,
         metadata=TemplateVersionMetadata(
             template_id=template_id,
             version=sv,
-            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            created_at=_FIXED_DT,
             description=description,
             author="tester",
             tags={"test"},
@@ -43,6 +47,8 @@ def _build_template_version(
     )
 
 
+# Build the click command once instead of on every invoke.
+cli = typer.main.get_command(app)
 runner = CliRunner()
 
 
@@ -52,11 +58,11 @@ runner = CliRunner()
 def test_templates_create__should_create_template_successfully(
     monkeypatch: pytest.MonkeyPatch,
 ):
-    mock_store = MagicMock()
+    mock_store = MagicMock(spec_set=TemplateStore)
     mock_store.create_template = MagicMock(return_value=None)
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "create"], input="my-prompt\n")
+    result = runner.invoke(cli, ["templates", "create"], input="my-prompt\n")
 
     assert result.exit_code == 0
     assert "my-prompt" in result.output
@@ -67,11 +73,11 @@ def test_templates_create__should_create_template_successfully(
 def test_templates_create__should_print_error_when_template_already_exists(
     monkeypatch: pytest.MonkeyPatch,
 ):
-    mock_store = MagicMock()
+    mock_store = MagicMock(spec_set=TemplateStore)
     mock_store.create_template = MagicMock(side_effect=FileExistsError("exists"))
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "create"], input="my-prompt\n")
+    result = runner.invoke(cli, ["templates", "create"], input="my-prompt\n")
 
     assert result.exit_code == 0
     assert "already exists" in result.output
@@ -83,15 +89,15 @@ def test_templates_create__should_print_error_when_template_already_exists(
 def test_templates_ls__should_list_templates(
     monkeypatch: pytest.MonkeyPatch,
 ):
+    mock_store = MagicMock(spec_set=TemplateStore)
     templates = [
         _build_template("prompt-a", "1.0.0"),
         _build_template("prompt-b", "2.1.0"),
     ]
-    mock_store = MagicMock()
-    mock_store.list_templates = MagicMock(return_value=templates)
+    mock_store.iter_templates = MagicMock(return_value=iter(templates))
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "ls"])
+    result = runner.invoke(cli, ["templates", "ls"])
 
     assert result.exit_code == 0
     assert "prompt-a" in result.output
@@ -103,16 +109,38 @@ def test_templates_ls__should_list_templates(
 def test_templates_ls__should_show_empty_table_when_no_templates(
     monkeypatch: pytest.MonkeyPatch,
 ):
-    mock_store = MagicMock()
-    mock_store.list_templates = MagicMock(return_value=[])
+    mock_store = MagicMock(spec_set=TemplateStore)
+    mock_store.iter_templates = MagicMock(return_value=iter([]))
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "ls"])
+    result = runner.invoke(cli, ["templates", "ls"])
 
     assert result.exit_code == 0
     assert "Prompt Templates" in result.output
 
 
+def test_templates_ls__should_skip_templates_the_store_cannot_read(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    valid_dir = tmp_path / "valid_prompt"
+    valid_dir.mkdir()
+    (valid_dir / "1.0.0.md").write_text(
+        "---\ntemplate_id: valid_prompt\nversion: 1.0.0\n---\nHello\n"
+    )
+    plain_dir = tmp_path / "plain_prompt"
+    plain_dir.mkdir()
+    (plain_dir / "3.0.0.md").write_text("plain text\n")
+    store = LocalTemplateStore(config={"base_path": tmp_path, "initial_version": None})
+    monkeypatch.setattr(templates_module, "get_store", lambda: store)
+
+    result = runner.invoke(cli, ["templates", "ls"])
+
+    assert result.exit_code == 0
+    assert "valid_prompt" in result.output
+    assert "plain_prompt" not in result.output
+
+
 # --- templates show ---
 
 
@@ -124,12 +152,12 @@ def test_templates_show__should_show_template_with_versions(
         _build_template_version("my-prompt", "1.0.0", description="First version"),
         _build_template_version("my-prompt", "2.0.0", description="Second version"),
     ]
-    mock_store = MagicMock()
+    mock_store = MagicMock(spec_set=TemplateStore)
     mock_store.get_template = MagicMock(return_value=template)
-    mock_store.list_template_versions = MagicMock(return_value=versions)
+    mock_store.iter_template_versions = MagicMock(return_value=iter(versions))
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "show", "my-prompt"])
+    result = runner.invoke(cli, ["templates", "show", "my-prompt"])
 
     assert result.exit_code == 0
     assert "my-prompt" in result.output
@@ -146,12 +174,12 @@ def test_templates_show__should_handle_version_with_no_description(
     versions = [
         _build_template_version("my-prompt", "1.0.0", description=None),
     ]
-    mock_store = MagicMock()
+    mock_store = MagicMock(spec_set=TemplateStore)
     mock_store.get_template = MagicMock(return_value=template)
-    mock_store.list_template_versions = MagicMock(return_value=versions)
+    mock_store.iter_template_versions = MagicMock(return_value=iter(versions))
     monkeypatch.setattr(templates_module, "get_store", lambda: mock_store)
 
-    result = runner.invoke(app, ["templates", "show", "my-prompt"])
+    result = runner.invoke(cli, ["templates", "show", "my-prompt"])
 
     assert result.exit_code == 0
     assert "1.0.0" in result.output
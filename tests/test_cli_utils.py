@@ -4,9 +4,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 import promptdepot.cli as cli_module
-import promptdepot.cli.utils as utils_module
+import promptdepot.cli.settings as settings_module
 from promptdepot.cli.settings import Settings, StoreSettings
-from promptdepot.cli.utils import get_store
+from promptdepot.cli.utils import cached_import, get_console, get_store
 from promptdepot.stores.local import LocalTemplateStore
 
 
@@ -19,7 +19,7 @@ def test_get_store__should_return_local_template_store_with_default_settings(
         store=StoreSettings(config={"base_path": str(tmp_path)}),
         _env_file=None,  # type: ignore[call-arg]
     )
-    monkeypatch.setattr(utils_module, "settings", fake_settings)
+    monkeypatch.setattr(settings_module, "get_settings", lambda: fake_settings)
 
     store = get_store()
 
@@ -40,7 +40,7 @@ def test_get_store__should_pass_config_to_store(
         ),
         _env_file=None,  # type: ignore[call-arg]
     )
-    monkeypatch.setattr(utils_module, "settings", fake_settings)
+    monkeypatch.setattr(settings_module, "get_settings", lambda: fake_settings)
 
     store = get_store()
 
@@ -55,7 +55,7 @@ def test_get_store__should_raise_when_store_path_module_not_found(
         store_path="nonexistent.module.FakeStore",
         _env_file=None,  # type: ignore[call-arg]
     )
-    monkeypatch.setattr(utils_module, "settings", fake_settings)
+    monkeypatch.setattr(settings_module, "get_settings", lambda: fake_settings)
 
     with pytest.raises(ModuleNotFoundError):
         get_store()
@@ -68,12 +68,35 @@ def test_get_store__should_raise_when_store_class_not_found(
         store_path="promptdepot.stores.local.NonExistentStore",
         _env_file=None,  # type: ignore[call-arg]
     )
-    monkeypatch.setattr(utils_module, "settings", fake_settings)
+    monkeypatch.setattr(settings_module, "get_settings", lambda: fake_settings)
 
     with pytest.raises(AttributeError):
         get_store()
 
 
+def test_cached_import__should_return_the_requested_attribute():
+    assert cached_import("promptdepot.stores.local", "LocalTemplateStore") is (
+        LocalTemplateStore
+    )
+
+
+def test_cached_import__should_not_cache_failed_lookups(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import promptdepot.stores.local as local_module
+
+    with pytest.raises(AttributeError):
+        cached_import("promptdepot.stores.local", "LateStore")
+
+    monkeypatch.setattr(local_module, "LateStore", LocalTemplateStore, raising=False)
+
+    assert cached_import("promptdepot.stores.local", "LateStore") is LocalTemplateStore
+
+
+def test_get_console__should_return_the_same_console_instance():
+    assert get_console() is get_console()
+
+
 def test_cli_main__should_call_app():
     mock_app = MagicMock()
     with patch.object(cli_module, "app", mock_app):
@@ -2,23 +2,25 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
-from pydantic_extra_types.semantic_version import SemanticVersion
-from typer.testing import CliRunner
+import typer
+from click.testing import CliRunner
 
 import promptdepot.cli.versions as versions_module
 from promptdepot.cli.main import app
 from promptdepot.stores.core import (
     CreationStrategy,
     Template,
+    TemplateStore,
     TemplateVersion,
     TemplateVersionMetadata,
+    as_semver,
 )
 
+_FIXED_DT = datetime(2025, 1, 1, 12, 0, 0)
+
 
 def _build_template(template_id: str, latest_version: str = "1.0.0") -> Template:
-    return Template(
-        id=template_id, latest_version=SemanticVersion.parse(latest_version)
-    )
+    return Template(id=template_id, latest_version=as_semver(latest_version))
 
 
 def _build_template_version(
@@ -31,14 +33,14 @@ def _build_template_version(
     model: str | None = "gpt-4",
     changelog: list[str] | None = None,
 ) -> TemplateVersion:
-    sv = SemanticVersion.parse(version)
+    sv = as_semver(version)
     return TemplateVersion(
         template_id=template_id,
         version=sv,
         metadata=TemplateVersionMetadata(
             template_id=template_id,
             version=sv,
-            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            created_at=_FIXED_DT,
             description=description,
             author=author,
             tags=tags or {"test"},
@@ -48,44 +50,43 @@ def _build_template_version(
     )
 
 
+# Build the click command once instead of on every invoke.
+cli = typer.main.get_command(app)
 runner = CliRunner()
 
 
-# --- versions create: strategy branches ---
-
-
-def test_versions_create__should_create_version_with_from_previous_flag(
-    monkeypatch: pytest.MonkeyPatch,
-):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+@pytest.fixture(autouse=True)
+def mock_store(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    store = MagicMock(spec_set=TemplateStore)
+    monkeypatch.setattr(versions_module, "get_store", lambda: store)
+    return store
 
-    result = runner.invoke(
-        app,
-        ["versions", "create", "my-prompt", "--version", "2.0.0", "--from-previous"],
-    )
 
-    assert result.exit_code == 0
-    assert "created successfully" in result.output
-    mock_store.create_version.assert_called_once_with(
-        template_id="my-prompt",
-        version="2.0.0",
-        strategy=CreationStrategy.FROM_PREVIOUS_VERSION,
-        content=None,
-    )
+# --- versions create: strategy branches ---
 
 
-def test_versions_create__should_create_version_with_empty_flag(
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.parametrize(
+    ("flags", "strategy", "content"),
+    [
+        (["--from-previous"], CreationStrategy.FROM_PREVIOUS_VERSION, None),
+        (["--empty"], CreationStrategy.EMPTY, None),
+        (
+            ["--with-content", "--content", "Hello ${name}"],
+            CreationStrategy.WITH_CONTENT,
+            "Hello ${name}",
+        ),
+    ],
+    ids=["from_previous", "empty", "with_content"],
+)
+def test_versions_create__should_create_version_with_strategy_flag(
+    mock_store: MagicMock,
+    flags: list[str],
+    strategy: CreationStrategy,
+    content: str | None,
 ):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
     result = runner.invoke(
-        app,
-        ["versions", "create", "my-prompt", "--version", "2.0.0", "--empty"],
+        cli,
+        ["versions", "create", "my-prompt", "--version", "2.0.0", *flags],
     )
 
     assert result.exit_code == 0
@@ -93,51 +94,16 @@ def test_versions_create__should_create_version_with_empty_flag(
     mock_store.create_version.assert_called_once_with(
         template_id="my-prompt",
         version="2.0.0",
-        strategy=CreationStrategy.EMPTY,
-        content=None,
-    )
-
-
-def test_versions_create__should_create_version_with_content_flag_and_content(
-    monkeypatch: pytest.MonkeyPatch,
-):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
-    result = runner.invoke(
-        app,
-        [
-            "versions",
-            "create",
-            "my-prompt",
-            "--version",
-            "2.0.0",
-            "--with-content",
-            "--content",
-            "Hello ${name}",
-        ],
-    )
-
-    assert result.exit_code == 0
-    assert "created successfully" in result.output
-    mock_store.create_version.assert_called_once_with(
-        template_id="my-prompt",
-        version="2.0.0",
-        strategy=CreationStrategy.WITH_CONTENT,
-        content="Hello ${name}",
+        strategy=strategy,
+        content=content,
     )
 
 
 def test_versions_create__should_default_to_from_previous_when_no_strategy_flag(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
     result = runner.invoke(
-        app,
+        cli,
         ["versions", "create", "my-prompt", "--version", "2.0.0"],
     )
 
@@ -154,17 +120,11 @@ def test_versions_create__should_default_to_from_previous_when_no_strategy_flag(
 
 
 def test_versions_create__should_prompt_for_version_when_not_provided(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
-    mock_store = MagicMock()
-    mock_store.get_template = MagicMock(
-        return_value=_build_template("my-prompt", "1.0.0")
-    )
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
+    mock_store.get_template.return_value = _build_template("my-prompt", "1.0.0")
     result = runner.invoke(
-        app,
+        cli,
         ["versions", "create", "my-prompt"],
         input="2.0.0\n",
     )
@@ -184,14 +144,10 @@ def test_versions_create__should_prompt_for_version_when_not_provided(
 
 
 def test_versions_create__should_prompt_for_content_when_with_content_and_no_content_provided(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
     result = runner.invoke(
-        app,
+        cli,
         [
             "versions",
             "create",
@@ -216,15 +172,9 @@ def test_versions_create__should_prompt_for_content_when_with_content_and_no_con
 # --- versions create: content warning ---
 
 
-def test_versions_create__should_warn_when_content_provided_with_non_with_content_strategy(
-    monkeypatch: pytest.MonkeyPatch,
-):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(return_value=None)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
-
+def test_versions_create__should_warn_when_content_provided_with_non_with_content_strategy():
     result = runner.invoke(
-        app,
+        cli,
         [
             "versions",
             "create",
@@ -246,14 +196,12 @@ def test_versions_create__should_warn_when_content_provided_with_non_with_conten
 
 
 def test_versions_create__should_print_error_when_version_already_exists(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
-    mock_store = MagicMock()
-    mock_store.create_version = MagicMock(side_effect=FileExistsError("exists"))
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+    mock_store.create_version.side_effect = FileExistsError("exists")
 
     result = runner.invoke(
-        app,
+        cli,
         ["versions", "create", "my-prompt", "--version", "1.0.0"],
     )
 
@@ -265,7 +213,7 @@ def test_versions_create__should_print_error_when_version_already_exists(
 
 
 def test_versions_ls__should_list_versions_with_metadata(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
     versions = [
         _build_template_version(
@@ -287,11 +235,9 @@ def test_versions_ls__should_list_versions_with_metadata(
             changelog=None,
         ),
     ]
-    mock_store = MagicMock()
-    mock_store.list_template_versions = MagicMock(return_value=versions)
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+    mock_store.iter_template_versions.return_value = iter(versions)
 
-    result = runner.invoke(app, ["versions", "ls", "my-prompt"])
+    result = runner.invoke(cli, ["versions", "ls", "my-prompt"])
 
     assert result.exit_code == 0
     assert "1.0.0" in result.output
@@ -301,13 +247,11 @@ def test_versions_ls__should_list_versions_with_metadata(
 
 
 def test_versions_ls__should_show_empty_table_when_no_versions(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
-    mock_store = MagicMock()
-    mock_store.list_template_versions = MagicMock(return_value=[])
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+    mock_store.iter_template_versions.return_value = iter([])
 
-    result = runner.invoke(app, ["versions", "ls", "my-prompt"])
+    result = runner.invoke(cli, ["versions", "ls", "my-prompt"])
 
     assert result.exit_code == 0
     assert "my-prompt" in result.output
@@ -317,7 +261,7 @@ def test_versions_ls__should_show_empty_table_when_no_versions(
 
 
 def test_versions_show__should_display_version_details(
-    monkeypatch: pytest.MonkeyPatch,
+    mock_store: MagicMock,
 ):
     version = _build_template_version(
         "my-prompt",
@@ -328,12 +272,10 @@ def test_versions_show__should_display_version_details(
         model="gpt-4",
         changelog=["initial release"],
     )
-    mock_store = MagicMock()
-    mock_store.get_template_version = MagicMock(return_value=version)
-    mock_store.get_template_version_content = MagicMock(return_value="Hello ${name}!")
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+    mock_store.get_template_version.return_value = version
+    mock_store.get_template_version_content.return_value = "Hello ${name}!"
 
-    result = runner.invoke(app, ["versions", "show", "my-prompt", "1.0.0"])
+    result = runner.invoke(cli, ["versions", "show", "my-prompt", "1.0.0"])
 
     assert result.exit_code == 0
     assert "my-prompt" in result.output
@@ -345,27 +287,40 @@ def test_versions_show__should_display_version_details(
     assert "Hello ${name}!" in result.output
 
 
+def test_versions_show__should_display_tags_sorted(
+    mock_store: MagicMock,
+):
+    version = _build_template_version("my-prompt", "1.0.0", tags={"beta", "alpha"})
+    mock_store.get_template_version.return_value = version
+    mock_store.get_template_version_content.return_value = ""
+
+    result = runner.invoke(cli, ["versions", "show", "my-prompt", "1.0.0"])
+
+    assert result.exit_code == 0
+    assert "alpha, beta" in result.output
+
+
 # --- versions create: mutually exclusive flags ---
 
 
-def test_versions_create__should_raise_when_multiple_strategy_flags_provided(
+def test_validate_strategy_flags__should_raise_when_multiple_flags_set():
+    with pytest.raises(typer.BadParameter, match="mutually exclusive"):
+        versions_module._validate_strategy_flags(
+            from_previous=True, empty=True, with_content=False
+        )
+
+
+def test_versions_create__should_validate_strategy_flags_before_using_store(
     monkeypatch: pytest.MonkeyPatch,
 ):
-    mock_store = MagicMock()
-    monkeypatch.setattr(versions_module, "get_store", lambda: mock_store)
+    get_store = MagicMock()
+    monkeypatch.setattr(versions_module, "get_store", get_store)
 
     result = runner.invoke(
-        app,
-        [
-            "versions",
-            "create",
-            "my-prompt",
-            "--version",
-            "2.0.0",
-            "--from-previous",
-            "--empty",
-        ],
+        cli,
+        ["versions", "create", "my-prompt", "--empty", "--with-content"],
     )
 
     assert result.exit_code != 0
     assert "mutually exclusive" in result.output
+    get_store.assert_not_called()
@@ -1,7 +1,10 @@
 from collections.abc import Mapping
+from enum import Enum
 from typing import Any
 
 import pytest
+from pydantic_extra_types.semantic_version import SemanticVersion
+
 from promptdepot.manager import PromptDepotManager
 from promptdepot.renderers.core import PromptRenderer
 from promptdepot.stores.core import (
@@ -62,6 +65,7 @@ class StubStore(TemplateStore):
 
 class RecordingRenderer(PromptRenderer[str, dict[str, Any]]):
     created_configs: list[dict[str, Any]] = []
+    render_calls: int = 0
 
     def __init__(self, template: str, *, config: dict[str, Any]):
         super().__init__(template=template, config=config)
@@ -69,12 +73,14 @@ class RecordingRenderer(PromptRenderer[str, dict[str, Any]]):
         self.config["mutated_by_renderer"] = True
 
     def render(self, *, context: Mapping[str, Any]) -> str:
+        RecordingRenderer.render_calls += 1
         return f"{self.template}|{context['name']}"
 
 
 @pytest.fixture(autouse=True)
 def reset_recording_renderer_configs() -> None:
     RecordingRenderer.created_configs = []
+    RecordingRenderer.render_calls = 0
 
 
 def test_prompt_depot_manager_get_prompt__should_cache_renderer_by_template_and_version():
@@ -132,3 +138,147 @@ def test_prompt_depot_manager_get_prompt__should_accept_mapping_context():
     result = manager.get_prompt("welcome", "1.0.0", context)
 
     assert result == "welcome:1.0.0|Dana"
+
+
+def test_prompt_depot_manager_get_prompt__should_cache_rendered_prompt_by_context():
+    manager = PromptDepotManager(
+        store=StubStore(), renderer=RecordingRenderer, render_cache_maxsize=128
+    )
+
+    first = manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    second = manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    third = manager.get_prompt("welcome", "1.0.0", {"name": "Bob"})
+
+    assert first == second == "welcome:1.0.0|Alice"
+    assert third == "welcome:1.0.0|Bob"
+    assert RecordingRenderer.render_calls == 2
+
+
+def test_prompt_depot_manager_get_prompt__should_render_unhashable_context_every_time():
+    manager = PromptDepotManager(
+        store=StubStore(), renderer=RecordingRenderer, render_cache_maxsize=128
+    )
+    context = {"name": "Alice", "items": ["a", "b"]}
+
+    manager.get_prompt("welcome", "1.0.0", context)
+    manager.get_prompt("welcome", "1.0.0", context)
+
+    assert RecordingRenderer.render_calls == 2
+    assert manager.render_cache == {}
+
+
+class MutableName:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __str__(self) -> str:
+        return self.name
+
+
+def test_prompt_depot_manager_get_prompt__should_not_cache_context_with_mutable_objects():
+    manager = PromptDepotManager(
+        store=StubStore(), renderer=RecordingRenderer, render_cache_maxsize=128
+    )
+    user = MutableName("Alice")
+
+    first = manager.get_prompt("welcome", "1.0.0", {"name": user})
+    user.name = "Bob"
+    second = manager.get_prompt("welcome", "1.0.0", {"name": user})
+
+    assert first == "welcome:1.0.0|Alice"
+    assert second == "welcome:1.0.0|Bob"
+    assert manager.render_cache == {}
+
+
+def test_prompt_depot_manager_get_prompt__should_cache_context_with_nested_tuples():
+    manager = PromptDepotManager(
+        store=StubStore(), renderer=RecordingRenderer, render_cache_maxsize=128
+    )
+    context = {"name": "Alice", "tags": ("a", frozenset({1, 2}))}
+
+    manager.get_prompt("welcome", "1.0.0", context)
+    manager.get_prompt("welcome", "1.0.0", dict(context))
+
+    assert RecordingRenderer.render_calls == 1
+
+
+def test_prompt_depot_manager_get_prompt__should_evict_least_recently_used_render():
+    manager = PromptDepotManager(
+        store=StubStore(), renderer=RecordingRenderer, render_cache_maxsize=2
+    )
+
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.0.0", {"name": "Bob"})
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.0.0", {"name": "Cara"})
+
+    assert list(manager.render_cache.values()) == [
+        "welcome:1.0.0|Alice",
+        "welcome:1.0.0|Cara",
+    ]
+
+
+def test_prompt_depot_manager_get_prompt__should_not_cache_renders_by_default():
+    manager = PromptDepotManager(store=StubStore(), renderer=RecordingRenderer)
+
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+
+    assert RecordingRenderer.render_calls == 2
+    assert manager.render_cache == {}
+
+
+def test_prompt_depot_manager_get_prompt__should_evict_least_recently_used_renderer():
+    store = StubStore()
+    manager = PromptDepotManager(
+        store=store,
+        renderer=RecordingRenderer,
+        renderer_cache_maxsize=2,
+        render_cache_maxsize=0,
+    )
+
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.1.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.2.0", {"name": "Alice"})
+    manager.get_prompt("welcome", "1.1.0", {"name": "Alice"})
+
+    assert list(manager.renderer_cache) == [
+        ("welcome", "1.2.0"),
+        ("welcome", "1.1.0"),
+    ]
+    assert store.get_template_version_content_calls == [
+        ("welcome", "1.0.0"),
+        ("welcome", "1.1.0"),
+        ("welcome", "1.2.0"),
+        ("welcome", "1.1.0"),
+    ]
+
+
+def test_prompt_depot_manager_get_prompt__should_share_cache_between_str_and_semver():
+    store = StubStore()
+    manager = PromptDepotManager(
+        store=store, renderer=RecordingRenderer, render_cache_maxsize=128
+    )
+
+    manager.get_prompt("welcome", "1.0.0", {"name": "Alice"})
+    manager.get_prompt("welcome", SemanticVersion.parse("1.0.0"), {"name": "Alice"})
+
+    assert store.get_template_version_content_calls == [("welcome", "1.0.0")]
+    assert RecordingRenderer.render_calls == 1
+
+
+class TemplateId(str, Enum):
+    WELCOME = "welcome"
+
+
+def test_prompt_depot_manager_get_prompt__should_accept_str_subclass_template_id():
+    store = StubStore()
+    manager = PromptDepotManager(store=store, renderer=RecordingRenderer)
+
+    first = manager.get_prompt(TemplateId.WELCOME, "1.0.0", {"name": "Alice"})
+    second = manager.get_prompt(TemplateId.WELCOME, "1.0.0", {"name": "Bob"})
+
+    assert first.endswith("|Alice")
+    assert second.endswith("|Bob")
+    assert store.get_template_version_content_calls == [(TemplateId.WELCOME, "1.0.0")]
@@ -82,3 +82,16 @@ def test_prompt_renderer__should_not_be_instantiable_without_render_implementati
 
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
         IncompleteRenderer(template="test", config={})
+
+
+def test_renderers_package__should_raise_for_unknown_attribute():
+    import promptdepot.renderers as renderers_package
+
+    with pytest.raises(AttributeError):
+        renderers_package.UnknownRenderer  # noqa: B018
+
+
+def test_renderers_package__should_keep_extras_backed_renderers_out_of_all():
+    import promptdepot.renderers as renderers_package
+
+    assert renderers_package.__all__ == ["PromptRenderer"]
@@ -106,3 +106,20 @@ def test_jinja2_prompt_renderer_render__should_render_with_multiple_variables():
     result = renderer.render(context={"name": "Alice", "age": 30})
 
     assert result == "Hello Alice, you are 30 years old"
+
+
+def test_jinja2_prompt_renderer_init__should_share_default_environment(
+    simple_template: str,
+    simple_config: Jinja2PromptRendererConfig,
+):
+    first = Jinja2PromptRenderer(template=simple_template, config=simple_config)
+    second = Jinja2PromptRenderer(template="Bye {{ name }}!", config=simple_config)
+
+    assert first.env is second.env
+    assert first.env.autoescape is True
+
+
+def test_renderers_package__should_lazily_export_jinja2_prompt_renderer():
+    import promptdepot.renderers as renderers_package
+
+    assert renderers_package.Jinja2PromptRenderer is Jinja2PromptRenderer
@@ -102,3 +102,29 @@ def test_mako_prompt_renderer_render__should_render_with_multiple_variables():
     result = renderer.render(context={"name": "Alice", "age": 30})
 
     assert result == "Hello Alice, you are 30 years old"
+
+
+def test_mako_prompt_renderer_init__should_reuse_compiled_template_without_lookup(
+    simple_template: str,
+    simple_config: MakoPromptRendererConfig,
+):
+    first = MakoPromptRenderer(template=simple_template, config=simple_config)
+    second = MakoPromptRenderer(template=simple_template, config=simple_config)
+
+    assert first.compiled_template is second.compiled_template
+
+
+def test_mako_prompt_renderer_init__should_compile_per_instance_with_lookup(
+    simple_template: str,
+    config_with_lookup: MakoPromptRendererConfig,
+):
+    first = MakoPromptRenderer(template=simple_template, config=config_with_lookup)
+    second = MakoPromptRenderer(template=simple_template, config=config_with_lookup)
+
+    assert first.compiled_template is not second.compiled_template
+
+
+def test_renderers_package__should_lazily_export_mako_prompt_renderer():
+    import promptdepot.renderers as renderers_package
+
+    assert renderers_package.MakoPromptRenderer is MakoPromptRenderer
@@ -1,8 +1,14 @@
+import os
+import shutil
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
+from pydantic_extra_types.semantic_version import SemanticVersion
 
 import promptdepot.stores.local as local_store_module
 from promptdepot.stores.core import (
@@ -10,6 +16,7 @@ from promptdepot.stores.core import (
     Template,
     TemplateVersion,
     TemplateVersionMetadata,
+    as_semver,
 )
 from promptdepot.stores.local import (
     LocalTemplateStore,
@@ -18,6 +25,25 @@ from promptdepot.stores.local import (
     VersionAlreadyExistsError,
 )
 
+_TEST_PROMPTS_DIR = Path(__file__).parent / "test_prompts"
+_TESTING_PROMPT_V1_FILE = _TEST_PROMPTS_DIR / "testing_prompt" / "1.0.0.md"
+
+_FIXED_DT = datetime(2024, 1, 15, 10, 30, 0)
+
+# Metadata of the checked-in tests/test_prompts/testing_prompt/1.0.0.md.
+_EXPECTED_METADATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "template_id": "testing_prompt",
+        "version": "1.0.0",
+        "created_at": _FIXED_DT,
+        "description": "A test prompt for validation purposes",
+        "author": "Aryan Curiel",
+        "tags": frozenset({"test", "example", "validation"}),
+        "model": "gpt-4",
+        "changelog": ("Initial release", "Added validation tests"),
+    }
+)
+
 
 def _make_config(base_path: Path | str) -> StoreConfig:
     return StoreConfig(
@@ -26,9 +52,21 @@ def _make_config(base_path: Path | str) -> StoreConfig:
     )
 
 
-@pytest.fixture
+def _make_template_dirs(store: LocalTemplateStore, *template_ids: str) -> None:
+    base_path = os.fspath(store.base_path)
+    os.makedirs(base_path, exist_ok=True)
+    for template_id in template_ids:
+        os.mkdir(os.path.join(base_path, template_id))
+
+
+def _assert_logged(caplog: pytest.LogCaptureFixture, text: str) -> None:
+    assert any(text in message for message in caplog.messages), caplog.messages
+
+
+# The checked-in tree is read-only, so one store can serve the whole module.
+@pytest.fixture(scope="module")
 def local_store() -> LocalTemplateStore:
-    return LocalTemplateStore(config=_make_config(Path("tests/test_prompts")))
+    return LocalTemplateStore(config=_make_config(_TEST_PROMPTS_DIR))
 
 
 @pytest.fixture
@@ -58,35 +96,65 @@ def test_local_template_store_read_prompt_metadata__should_raise_when_file_does_
 
 def assert_metadata_equal(
     metadata: TemplateVersionMetadata,
-    expected: dict,
+    expected: Mapping[str, Any],
 ):
-    assert metadata.template_id == expected["template_id"]
-    assert str(metadata.version) == expected["version"]
-    assert metadata.created_at == expected["created_at"]
-    assert metadata.description == expected["description"]
-    assert metadata.author == expected["author"]
-    assert metadata.tags == expected["tags"]
-    assert metadata.model == expected["model"]
-    assert metadata.changelog == expected["changelog"]
+    assert metadata.model_dump() == {
+        **expected,
+        "version": as_semver(expected["version"]),
+        "changelog": list(expected["changelog"]),
+    }
+
+
+def test_local_template_store_read_prompt_metadata__should_raise_when_path_is_a_directory(
+    temp_local_store: LocalTemplateStore,
+):
+    version_dir = temp_local_store.base_path / "testing_prompt" / "1.0.0.md"
+    version_dir.mkdir(parents=True)
+
+    with pytest.raises(TemplateNotFoundError, match="is not a file"):
+        temp_local_store._read_prompt_metadata(version_dir)
 
 
 def test_local_template_store_read_prompt_metadata__should_read_and_parse_metadata_correctly(
     local_store: LocalTemplateStore,
 ):
     metadata: TemplateVersionMetadata = local_store._read_prompt_metadata(
-        local_store.base_path / "testing_prompt" / "1.0.0.md"
+        _TESTING_PROMPT_V1_FILE
     )
-    expected_metadata = {
-        "template_id": "testing_prompt",
-        "version": "1.0.0",
-        "created_at": datetime.fromisoformat("2024-01-15T10:30:00"),
-        "description": "A test prompt for validation purposes",
-        "author": "Aryan Curiel",
-        "tags": {"test", "example", "validation"},
-        "model": "gpt-4",
-        "changelog": ["Initial release", "Added validation tests"],
-    }
-    assert_metadata_equal(metadata, expected_metadata)
+    assert_metadata_equal(metadata, _EXPECTED_METADATA)
+
+
+def test_local_template_store_read_prompt_metadata__should_reuse_parsed_frontmatter_until_file_changes(
+    temp_local_store: LocalTemplateStore,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    template_file = temp_local_store.base_path / "cached_prompt" / "1.0.0.md"
+    template_file.parent.mkdir(parents=True)
+    template_file.write_text("---\ntemplate_id: cached_prompt\nversion: 1.0.0\n---\n")
+
+    parse_calls: list[str | bytes] = []
+    original_load_yaml = local_store_module._load_yaml
+
+    def _counting_load_yaml(content: str | bytes) -> Any:
+        parse_calls.append(content)
+        return original_load_yaml(content)
+
+    monkeypatch.setattr(local_store_module, "_load_yaml", _counting_load_yaml)
+
+    first = temp_local_store._read_prompt_metadata(template_file)
+    second = temp_local_store._read_prompt_metadata(template_file)
+    assert first.template_id == second.template_id == "cached_prompt"
+    assert first is not second
+    assert len(parse_calls) == 1
+
+    template_file.write_text(
+        "---\ntemplate_id: cached_prompt\nversion: 1.0.0\nauthor: Someone Else\n---\n"
+    )
+
+    assert temp_local_store._read_prompt_metadata(template_file).author == (
+        "Someone Else"
+    )
+    assert len(parse_calls) == 2
 
 
 def test_local_template_store_get_template__should_raise_when_template_does_not_exist(
@@ -112,53 +180,40 @@ def test_local_template_store_get_template__should_return_latest_version(
     assert str(template.latest_version) == "1.1.0"
 
 
-def test_local_template_store_get_template_version__should_raise_when_template_does_not_exist(
-    local_store: LocalTemplateStore,
-):
-    with pytest.raises(TemplateNotFoundError):
-        local_store.get_template_version("non_existent_template", "1.0.0")
-
-
-def test_local_template_store_get_template_version__should_raise_when_template_incomplete(
-    local_store: LocalTemplateStore,
-):
-    with pytest.raises(TemplateNotFoundError):
-        local_store.get_template_version("testing_prompt_incomplete", "1.0.0")
-
-
-def test_local_template_store_get_template_version__should_raise_when_version_does_not_exist(
+@pytest.mark.parametrize(
+    ("template_id", "version"),
+    [
+        ("non_existent_template", "1.0.0"),
+        ("testing_prompt_incomplete", "1.0.0"),
+        ("testing_prompt", "999.0.0"),
+    ],
+    ids=["template_missing", "template_incomplete", "version_missing"],
+)
+def test_local_template_store_get_template_version__should_raise_when_version_is_not_found(
     local_store: LocalTemplateStore,
+    template_id: str,
+    version: str,
 ):
     with pytest.raises(TemplateNotFoundError):
-        local_store.get_template_version("testing_prompt", "999.0.0")
+        local_store.get_template_version(template_id, version)
 
 
 def test_local_template_store_get_template_version__should_return_correct_template_version(
     local_store: LocalTemplateStore,
 ):
-    expected_metadata = {
-        "template_id": "testing_prompt",
-        "version": "1.0.0",
-        "created_at": datetime.fromisoformat("2024-01-15T10:30:00"),
-        "description": "A test prompt for validation purposes",
-        "author": "Aryan Curiel",
-        "tags": {"test", "example", "validation"},
-        "model": "gpt-4",
-        "changelog": ["Initial release", "Added validation tests"],
-    }
     template_version = local_store.get_template_version(
-        "testing_prompt", expected_metadata["version"]
+        "testing_prompt", _EXPECTED_METADATA["version"]
     )
     assert isinstance(template_version, TemplateVersion)
     assert template_version.template_id == "testing_prompt"
     assert str(template_version.version) == "1.0.0"
-    assert_metadata_equal(template_version.metadata, expected_metadata)
+    assert_metadata_equal(template_version.metadata, _EXPECTED_METADATA)
 
 
 def test_local_template_store_list_templates__should_return_empty_list_when_base_path_has_no_dirs(
     temp_local_store: LocalTemplateStore,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
+    _make_template_dirs(temp_local_store)
 
     templates = temp_local_store.list_templates()
 
@@ -172,7 +227,7 @@ def _build_template_version(
     metadata = TemplateVersionMetadata(
         template_id=template_id,
         version=version,
-        created_at=datetime.fromisoformat("2024-01-15T10:30:00"),
+        created_at=_FIXED_DT,
         description="A test prompt for create_version",
         author="Aryan Curiel",
         tags={"test"},
@@ -190,9 +245,8 @@ def test_local_template_store_list_templates__should_skip_non_directory_entries(
     temp_local_store: LocalTemplateStore,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
-    (temp_local_store.base_path / "not_a_template.txt").write_text("ignore me")
-    (temp_local_store.base_path / "template_a").mkdir()
+    _make_template_dirs(temp_local_store, "template_a")
+    (temp_local_store.base_path / "not_a_template.txt").touch()
 
     calls: list[str] = []
 
@@ -215,9 +269,7 @@ def test_local_template_store_list_templates__should_return_templates_sorted_by_
     temp_local_store: LocalTemplateStore,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
-    (temp_local_store.base_path / "z_template").mkdir()
-    (temp_local_store.base_path / "a_template").mkdir()
+    _make_template_dirs(temp_local_store, "z_template", "a_template")
 
     def _fake_get_latest_version(template_id: str) -> TemplateVersion:
         return _build_template_version(template_id=template_id, version="1.0.0")
@@ -227,9 +279,7 @@ def test_local_template_store_list_templates__should_return_templates_sorted_by_
     )
 
     templates = temp_local_store.list_templates()
-    template_ids = [t.id for t in templates]
-
-    assert template_ids == ["a_template", "z_template"]
+    assert [t.id for t in templates] == ["a_template", "z_template"]
 
 
 def test_local_template_store_list_templates__should_skip_template_and_log_warning_on_template_not_found(
@@ -237,9 +287,7 @@ def test_local_template_store_list_templates__should_skip_template_and_log_warni
     monkeypatch: pytest.MonkeyPatch,
     caplog: pytest.LogCaptureFixture,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
-    (temp_local_store.base_path / "valid_template").mkdir()
-    (temp_local_store.base_path / "missing_template").mkdir()
+    _make_template_dirs(temp_local_store, "valid_template", "missing_template")
 
     def _fake_get_latest_version(template_id: str) -> TemplateVersion:
         if template_id == "missing_template":
@@ -253,11 +301,9 @@ def test_local_template_store_list_templates__should_skip_template_and_log_warni
     with caplog.at_level("WARNING"):
         templates = temp_local_store.list_templates()
 
-    template_ids = [t.id for t in templates]
-    assert template_ids == ["valid_template"]
-    assert (
-        "No valid versions found for template 'missing_template'. Skipping."
-        in caplog.text
+    assert [t.id for t in templates] == ["valid_template"]
+    _assert_logged(
+        caplog, "No valid versions found for template 'missing_template'. Skipping."
     )
 
 
@@ -269,12 +315,15 @@ def _build_validation_error() -> ValidationError:
     raise AssertionError("Expected ValidationError to be raised")
 
 
+_VALIDATION_ERROR = _build_validation_error()
+
+
 @pytest.mark.parametrize(
     "error",
     [
         ValueError("invalid value"),
         OSError("io error"),
-        _build_validation_error(),
+        _VALIDATION_ERROR,
     ],
 )
 def test_local_template_store_list_templates__should_skip_template_and_log_error_on_read_errors(
@@ -283,9 +332,7 @@ def test_local_template_store_list_templates__should_skip_template_and_log_error
     caplog: pytest.LogCaptureFixture,
     error: Exception,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
-    (temp_local_store.base_path / "ok_template").mkdir()
-    (temp_local_store.base_path / "bad_template").mkdir()
+    _make_template_dirs(temp_local_store, "ok_template", "bad_template")
 
     def _fake_get_latest_version(template_id: str) -> TemplateVersion:
         if template_id == "bad_template":
@@ -299,9 +346,8 @@ def test_local_template_store_list_templates__should_skip_template_and_log_error
     with caplog.at_level("ERROR"):
         templates = temp_local_store.list_templates()
 
-    template_ids = [t.id for t in templates]
-    assert template_ids == ["ok_template"]
-    assert "Error reading template 'bad_template':" in caplog.text
+    assert [t.id for t in templates] == ["ok_template"]
+    _assert_logged(caplog, "Error reading template 'bad_template':")
 
 
 def test_local_template_store_list_template_versions__should_raise_when_template_does_not_exist(
@@ -323,9 +369,40 @@ def test_local_template_store_list_template_versions__should_return_correct_vers
     local_store: LocalTemplateStore,
 ):
     versions = local_store.list_template_versions("testing_prompt")
-    version_strings = {str(v.version) for v in versions}
-    assert "1.0.0" in version_strings
-    assert "1.1.0" in version_strings
+    assert {str(v.version) for v in versions} >= {"1.0.0", "1.1.0"}
+
+
+def test_local_template_store_iter_template_versions__should_raise_before_iteration_when_template_does_not_exist(
+    local_store: LocalTemplateStore,
+):
+    with pytest.raises(TemplateNotFoundError):
+        local_store.iter_template_versions("non_existent_template")
+
+
+def test_local_template_store_iter_template_versions__should_yield_same_versions_as_list(
+    local_store: LocalTemplateStore,
+):
+    iterated = list(local_store.iter_template_versions("testing_prompt"))
+    assert iterated == local_store.list_template_versions("testing_prompt")
+
+
+def test_local_template_store_list_template_versions__should_order_by_semantic_version(
+    temp_local_store: LocalTemplateStore,
+):
+    for version in ("10.0.0", "2.0.0", "1.0.0"):
+        temp_local_store.create_version(
+            "ordered_prompt", version, strategy=CreationStrategy.EMPTY
+        )
+
+    versions = temp_local_store.list_template_versions("ordered_prompt")
+
+    assert [str(v.version) for v in versions] == ["1.0.0", "2.0.0", "10.0.0"]
+
+
+def test_local_template_store_iter_templates__should_yield_same_templates_as_list(
+    local_store: LocalTemplateStore,
+):
+    assert list(local_store.iter_templates()) == local_store.list_templates()
 
 
 @pytest.mark.parametrize(
@@ -333,7 +410,7 @@ def test_local_template_store_list_template_versions__should_return_correct_vers
     [
         ValueError("invalid value"),
         OSError("io error"),
-        _build_validation_error(),
+        _VALIDATION_ERROR,
     ],
 )
 def test_local_template_store_list_template_versions__should_skip_version_and_log_error_on_read_errors(
@@ -342,13 +419,12 @@ def test_local_template_store_list_template_versions__should_skip_version_and_lo
     caplog: pytest.LogCaptureFixture,
     error: Exception,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
+    _make_template_dirs(temp_local_store, "testing_prompt")
     template_dir = temp_local_store.base_path / "testing_prompt"
-    template_dir.mkdir()
 
-    (template_dir / "1.0.0.md").write_text("")
-    (template_dir / "1.1.0.md").write_text("")
-    (template_dir / "1.2.0.md").write_text("")
+    (template_dir / "1.0.0.md").touch()
+    (template_dir / "1.1.0.md").touch()
+    (template_dir / "1.2.0.md").touch()
 
     def _fake_get_template_version(template_id: str, version: str) -> TemplateVersion:
         if version == "1.1.0":
@@ -362,29 +438,29 @@ def test_local_template_store_list_template_versions__should_skip_version_and_lo
     with caplog.at_level("ERROR"):
         versions = temp_local_store.list_template_versions("testing_prompt")
 
-    version_strings = [str(v.version) for v in versions]
-    assert version_strings == ["1.0.0", "1.2.0"]
-    assert "Error reading template 'testing_prompt' version '1.1.0':" in caplog.text
+    assert [str(v.version) for v in versions] == ["1.0.0", "1.2.0"]
+    _assert_logged(caplog, "Error reading template 'testing_prompt' version '1.1.0':")
 
 
 def test_local_template_store_list_template_versions__should_skip_non_md_files(
     local_store: LocalTemplateStore,
 ):
     versions = local_store.list_template_versions("testing_prompt_unexpected_file")
-    version_strings = {str(v.version) for v in versions}
-    assert "1.0.0" in version_strings
+    assert "1.0.0" in {str(v.version) for v in versions}
 
 
 def test_local_template_store_list_template_versions__should_skip_subdirectories(
-    local_store: LocalTemplateStore,
+    temp_local_store: LocalTemplateStore,
 ):
-    # Ensure there is a subdirectory present so that the subdirectory-skipping
-    # logic in list_template_versions is actually exercised.
-    unexpected_folder = local_store.base_path / "testing_prompt_unexpected_folder"
-    (unexpected_folder / "some_dir").mkdir(parents=True, exist_ok=True)
-    versions = local_store.list_template_versions("testing_prompt_unexpected_folder")
-    version_strings = {str(v.version) for v in versions}
-    assert "1.0.0" in version_strings
+    # Build the tree in tmp_path: the shared local_store fixture is read-only.
+    template_id = "testing_prompt_unexpected_folder"
+    template_dir = temp_local_store.base_path / template_id
+    (template_dir / "some_dir").mkdir(parents=True)
+    shutil.copy(_TEST_PROMPTS_DIR / template_id / "1.0.0.md", template_dir)
+
+    versions = temp_local_store.list_template_versions(template_id)
+
+    assert [str(v.version) for v in versions] == ["1.0.0"]
 
 
 def test_local_template_store_list_templates__should_handle_multiple_templates_with_mixed_errors(
@@ -392,12 +468,14 @@ def test_local_template_store_list_templates__should_handle_multiple_templates_w
     monkeypatch: pytest.MonkeyPatch,
     caplog: pytest.LogCaptureFixture,
 ):
-    temp_local_store.base_path.mkdir(parents=True, exist_ok=True)
-    (temp_local_store.base_path / "template_good_1").mkdir()
-    (temp_local_store.base_path / "template_value_error").mkdir()
-    (temp_local_store.base_path / "template_os_error").mkdir()
-    (temp_local_store.base_path / "template_validation_error").mkdir()
-    (temp_local_store.base_path / "template_good_2").mkdir()
+    _make_template_dirs(
+        temp_local_store,
+        "template_good_1",
+        "template_value_error",
+        "template_os_error",
+        "template_validation_error",
+        "template_good_2",
+    )
 
     def _fake_get_latest_version(template_id: str) -> TemplateVersion:
         if template_id == "template_value_error":
@@ -415,11 +493,10 @@ def test_local_template_store_list_templates__should_handle_multiple_templates_w
     with caplog.at_level("ERROR"):
         templates = temp_local_store.list_templates()
 
-    template_ids = [t.id for t in templates]
-    assert template_ids == ["template_good_1", "template_good_2"]
-    assert "Error reading template 'template_value_error':" in caplog.text
-    assert "Error reading template 'template_os_error':" in caplog.text
-    assert "Error reading template 'template_validation_error':" in caplog.text
+    assert [t.id for t in templates] == ["template_good_1", "template_good_2"]
+    _assert_logged(caplog, "Error reading template 'template_value_error':")
+    _assert_logged(caplog, "Error reading template 'template_os_error':")
+    _assert_logged(caplog, "Error reading template 'template_validation_error':")
 
 
 def test_local_template_store_get_latest_version__should_raise_when_no_versions_exist(
@@ -436,6 +513,61 @@ def test_local_template_store_get_latest_version__should_return_latest_version(
     assert str(latest.version) == "1.1.0"
 
 
+def test_local_template_store_get_latest_version__should_only_read_latest_version(
+    local_store: LocalTemplateStore,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    read_versions: list[str] = []
+    original_get_template_version = local_store.get_template_version
+
+    def _recording_get_template_version(template_id, version):
+        read_versions.append(str(version))
+        return original_get_template_version(template_id, version)
+
+    monkeypatch.setattr(
+        local_store, "get_template_version", _recording_get_template_version
+    )
+
+    latest = local_store.get_latest_version("testing_prompt")
+
+    assert str(latest.version) == "1.1.0"
+    assert read_versions == ["1.1.0"]
+
+
+def test_local_template_store_get_latest_version__should_fall_back_when_latest_is_invalid(
+    temp_local_store: LocalTemplateStore,
+    caplog: pytest.LogCaptureFixture,
+):
+    temp_local_store.create_version(
+        "fallback_prompt", "1.0.0", strategy=CreationStrategy.EMPTY
+    )
+    template_dir = temp_local_store.base_path / "fallback_prompt"
+    (template_dir / "1.1.0.md").write_text("---\nrandom: random\n---\n")
+    (template_dir / "2.0.0.md").write_text("no frontmatter")
+
+    with caplog.at_level("ERROR"):
+        latest = temp_local_store.get_latest_version("fallback_prompt")
+
+    assert str(latest.version) == "1.0.0"
+    _assert_logged(caplog, "Error reading template 'fallback_prompt' version '1.1.0'")
+
+
+def test_local_template_store_get_latest_version__should_log_invalid_version_file_names(
+    temp_local_store: LocalTemplateStore,
+    caplog: pytest.LogCaptureFixture,
+):
+    temp_local_store.create_version(
+        "draft_prompt", "1.0.0", strategy=CreationStrategy.EMPTY
+    )
+    (temp_local_store.base_path / "draft_prompt" / "draft.md").write_text("WIP")
+
+    with caplog.at_level("ERROR"):
+        latest = temp_local_store.get_latest_version("draft_prompt")
+
+    assert str(latest.version) == "1.0.0"
+    _assert_logged(caplog, "Error reading template 'draft_prompt' version 'draft'")
+
+
 def test_local_template_store_create_version__should_create_file_with_frontmatter_when_strategy_empty(
     temp_local_store: LocalTemplateStore,
 ):
@@ -459,7 +591,7 @@ def test_local_template_store_create_version__should_raise_when_version_already_
 ):
     version_file = temp_local_store.base_path / "testing_prompt" / "1.0.0.md"
     version_file.parent.mkdir(parents=True, exist_ok=True)
-    version_file.write_text("")
+    version_file.write_text("existing")
 
     with pytest.raises(VersionAlreadyExistsError):
         temp_local_store.create_version(
@@ -468,6 +600,8 @@ def test_local_template_store_create_version__should_raise_when_version_already_
             strategy=CreationStrategy.EMPTY,
         )
 
+    assert version_file.read_text() == "existing"
+
 
 def test_local_template_store_create_version__should_copy_latest_template_content_when_strategy_from_previous(
     temp_local_store: LocalTemplateStore,
@@ -518,7 +652,7 @@ def test_local_template_store_create_version__should_fallback_to_empty_content_w
     assert (
         temp_local_store.get_template_version_content("testing_prompt", "1.0.0") == ""
     )
-    assert "No existing versions found for template 'testing_prompt'" in caplog.text
+    _assert_logged(caplog, "No existing versions found for template 'testing_prompt'")
 
 
 def test_local_template_store_create_version__should_dump_metadata_using_model_dump_json_mode(
@@ -527,16 +661,16 @@ def test_local_template_store_create_version__should_dump_metadata_using_model_d
 ):
     captured: dict = {}
 
-    def _fake_safe_dump(data):
+    def _fake_dump_yaml(data):
         captured["data"] = data
         return "serialized-metadata\n"
 
-    monkeypatch.setattr(local_store_module, "safe_dump", _fake_safe_dump)
+    monkeypatch.setattr(local_store_module, "_dump_yaml", _fake_dump_yaml)
 
     metadata = TemplateVersionMetadata(
         template_id="testing_prompt",
         version="1.0.0",
-        created_at=datetime.fromisoformat("2024-01-15T10:30:00"),
+        created_at=_FIXED_DT,
         description="A test prompt for create_version",
         author="Aryan Curiel",
         tags={"test"},
@@ -599,9 +733,8 @@ def test_local_template_store_create_version__should_warn_when_content_provided_
             content="this will be ignored",
         )
 
-    assert (
-        "Content provided will be ignored because of the creation strategy."
-        in caplog.text
+    _assert_logged(
+        caplog, "Content provided will be ignored because of the creation strategy."
     )
     assert (
         temp_local_store.get_template_version_content("testing_prompt", "1.0.0") == ""
@@ -619,9 +752,8 @@ def test_local_template_store_create_version__should_warn_when_with_content_stra
             strategy=CreationStrategy.WITH_CONTENT,
         )
 
-    assert (
-        "Creation strategy 'WITH_CONTENT' specified but no content provided."
-        in caplog.text
+    _assert_logged(
+        caplog, "Creation strategy 'WITH_CONTENT' specified but no content provided."
     )
     assert (
         temp_local_store.get_template_version_content("testing_prompt", "1.0.0") == ""
@@ -651,6 +783,79 @@ def test_local_template_store_get_template_version_content__should_raise_when_te
         temp_local_store.get_template_version_content("testing_prompt", "1.0.0")
 
 
+def test_local_template_store_read_prompt_metadata__should_parse_crlf_frontmatter(
+    temp_local_store: LocalTemplateStore,
+):
+    template_dir = temp_local_store.base_path / "testing_prompt"
+    template_dir.mkdir(parents=True, exist_ok=True)
+    template_file = template_dir / "1.0.0.md"
+    template_file.write_bytes(
+        b"---\r\n"
+        b"template_id: testing_prompt\r\n"
+        b"version: 1.0.0\r\n"
+        b"created_at: 2025-01-01T00:00:00\r\n"
+        b"author: crlf\r\n"
+        b"---\r\n"
+        b"Hello\r\n"
+    )
+
+    metadata = temp_local_store._read_prompt_metadata(template_file)
+
+    assert metadata.author == "crlf"
+
+
+def test_local_template_store_list_templates__should_skip_template_with_non_utf8_frontmatter(
+    temp_local_store: LocalTemplateStore,
+    caplog: pytest.LogCaptureFixture,
+):
+    good_dir = temp_local_store.base_path / "good"
+    good_dir.mkdir(parents=True)
+    (good_dir / "1.0.0.md").write_text("---\ntemplate_id: good\nversion: 1.0.0\n---\n")
+    bad_dir = temp_local_store.base_path / "bad"
+    bad_dir.mkdir()
+    (bad_dir / "1.0.0.md").write_bytes(
+        b"---\ntemplate_id: bad\nversion: 1.0.0\nauthor: Jos\xe9\n---\n"
+    )
+
+    templates = temp_local_store.list_templates()
+
+    assert [t.id for t in templates] == ["good"]
+    _assert_logged(caplog, "Error reading template 'bad' version '1.0.0'")
+
+
+def test_local_template_store_get_template_version_content__should_reuse_body_until_file_changes(
+    temp_local_store: LocalTemplateStore,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    template_file = temp_local_store.base_path / "cached_prompt" / "1.0.0.md"
+    template_file.parent.mkdir(parents=True)
+    template_file.write_text("---\ntemplate_id: cached_prompt\n---\nHello\n")
+
+    parse_calls: list[str] = []
+    original_parse_frontmatter = local_store_module._parse_frontmatter
+
+    def _counting_parse_frontmatter(content: str) -> tuple[dict, str]:
+        parse_calls.append(content)
+        return original_parse_frontmatter(content)
+
+    monkeypatch.setattr(
+        local_store_module, "_parse_frontmatter", _counting_parse_frontmatter
+    )
+
+    first = temp_local_store.get_template_version_content("cached_prompt", "1.0.0")
+    second = temp_local_store.get_template_version_content("cached_prompt", "1.0.0")
+    assert first == second == "Hello\n"
+    assert len(parse_calls) == 1
+
+    template_file.write_text("---\ntemplate_id: cached_prompt\n---\nHello again\n")
+
+    assert (
+        temp_local_store.get_template_version_content("cached_prompt", "1.0.0")
+        == "Hello again\n"
+    )
+    assert len(parse_calls) == 2
+
+
 def test_local_template_store_get_template_path__should_return_correct_path(
     local_store: LocalTemplateStore,
 ):
@@ -659,6 +864,13 @@ def test_local_template_store_get_template_path__should_return_correct_path(
     assert path == expected
 
 
+def test_local_template_store_get_template_file__should_match_template_path(
+    local_store: LocalTemplateStore,
+):
+    path = local_store._get_template_file("testing_prompt", "1.0.0")
+    assert path == str(local_store._get_template_path("testing_prompt", "1.0.0"))
+
+
 def test_local_template_store_list_template_versions__should_skip_md_file_without_frontmatter(
     temp_local_store: LocalTemplateStore,
 ):
@@ -682,3 +894,40 @@ def test_local_template_store_list_template_versions__should_skip_md_file_withou
     versions = temp_local_store.list_template_versions("testing_prompt")
     assert len(versions) == 1
     assert str(versions[0].version) == "1.0.0"
+
+
+def test_stores_package__should_lazily_export_local_template_store():
+    import promptdepot.stores as stores_package
+
+    assert stores_package.LocalTemplateStore is LocalTemplateStore
+
+
+def test_stores_package__should_raise_for_unknown_attribute():
+    import promptdepot.stores as stores_package
+
+    with pytest.raises(AttributeError):
+        stores_package.UnknownStore  # noqa: B018
+
+
+def test_as_semver__should_reuse_parsed_version_for_same_string():
+    parsed = as_semver("1.2.3")
+
+    assert parsed == SemanticVersion(major=1, minor=2, patch=3)
+    assert as_semver("1.2.3") is parsed
+
+
+def test_as_semver__should_return_semantic_version_unchanged():
+    version = SemanticVersion(major=2)
+
+    assert as_semver(version) is version
+
+
+def test_template_version_metadata_init__should_not_share_default_collections():
+    first = TemplateVersionMetadata(template_id="a", version="1.0.0")
+    second = TemplateVersionMetadata(template_id="b", version="1.0.0")
+
+    first.tags.add("tag")
+    first.changelog.append("change")
+
+    assert second.tags == set()
+    assert second.changelog == []